@@ -1,8 +1,9 @@
 from __future__ import annotations
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 import functools
-from typing import Iterable, TypedDict
+import os
+from typing import Callable, TypedDict
 
 
 # Just to have a little type-safety
@@ -23,7 +24,7 @@ class Play(TypedDict):
 AllPlays = dict[str, Play]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatementLine:
     """Representing a single line on the invoice"""
     play_name: str
@@ -31,107 +32,100 @@ class StatementLine:
     seats: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Statement:
     """Representing the final statement."""
     customer: str
-    statement_lines: Iterable[StatementLine]
+    statement_lines: tuple[StatementLine, ...]
     credits: int
+    total: int = field(init=False, repr=False, compare=False)
 
-    @property
-    def total(self):
-        return sum(s.amount for s in self.statement_lines)
+    def __post_init__(self):
+        # Guard against callers handing in a one-shot iterable
+        object.__setattr__(self, "statement_lines", tuple(self.statement_lines))
+        object.__setattr__(self, "total", sum(s.amount for s in self.statement_lines))
 
 
+@functools.lru_cache(maxsize=1024)
 def format_as_dollars(cents: int) -> str:
-    return f"${cents/100:0,.2f}"
+    sign = "-" if cents < 0 else ""
+    dollars, cents = divmod(abs(cents), 100)
+    return f"{sign}${dollars:,}.{cents:02d}"
 
 
 def render_as_text(statement: Statement) -> str:
-    result = f"Statement for {statement.customer}\n"
-    for line in statement.statement_lines:
-        result += f" {line.play_name}: {format_as_dollars(line.amount)} ({line.seats} seats)\n"
-    result += f"Amount owed is {format_as_dollars(statement.total)}\n"
-    result += f"You earned {statement.credits} credits\n"
-    return result
+    parts = [f"Statement for {statement.customer}"]
+    parts.extend(
+        f" {line.play_name}: {format_as_dollars(line.amount)} ({line.seats} seats)"
+        for line in statement.statement_lines
+    )
+    parts.append(f"Amount owed is {format_as_dollars(statement.total)}")
+    parts.append(f"You earned {statement.credits} credits")
+    return "\n".join(parts) + "\n"
 
 
 def render_as_html(statement: Statement) -> str:
-    result = f"<h1>Statement for {statement.customer}</h1>\n"
-    result += "<table>\n"
-    result += "<tr><th>play</th><th>seats</th><th>cost</th></tr>\n"
-    for line in statement.statement_lines:
-        result += f" <tr><td>{line.play_name}</td><td>{line.seats}</td>"
-        result += f"<td>{format_as_dollars(statement.total)}</td></tr>\n"
-    result += "</table>\n"
-    result += f"<p>Amount owed is <em>{format_as_dollars(statement.total)}</em></p>\n"
-    result += f"<p>You earned <em>{statement.credits}</em> credits</p>"
-    return result
-
-
-class BillingStrategy(ABC):
-    def __init__(self, play: Play, perf: Performance):
-        self._play = play
-        self._perf = perf
-
-    @property
-    def name(self) -> str:
-        return self._play["name"]
-
-    @property
-    def audience(self) -> int:
-        return self._perf["audience"]
-
-    def credits(self) -> int:
-        return max(self.audience - 30, 0)
-
-    def statement_line(self) -> StatementLine:
-        return StatementLine(self.name, self.amount(), self.audience)
-
-    @abstractmethod
-    def amount(self) -> int:
-        ...
-
-
-class TragedyBilling(BillingStrategy):
-    def amount(self) -> int:
-        amount = 40000
-        if self.audience > 30:
-            amount += 1000 * (self.audience - 30)
-        return amount
-
-
-class ComedyBilling(BillingStrategy):
-    def amount(self) -> int:
-        amount = 30000 + 300 * self.audience
-        if self.audience > 20:
-            amount += 10000 + 500 * (self.audience - 20)
-        return amount
-
-    def credits(self) -> int:
-        return super().credits() + self.audience // 5
-
-# Add new BillingStrategies here
-
-def billing_strategy(plays: AllPlays, perf: Performance) -> BillingStrategy:
-    play_type = plays[perf["playID"]]["type"]
-    match play_type:
-        case "tragedy":
-            return TragedyBilling(plays[perf["playID"]], perf)
-        case "comedy":
-            return ComedyBilling(plays[perf["playID"]], perf)
-        # Insert new play_types here
-        case _:
-            raise ValueError(f"unknown type: {play_type}")
+    parts = [
+        f"<h1>Statement for {statement.customer}</h1>",
+        "<table>",
+        "<tr><th>play</th><th>seats</th><th>cost</th></tr>",
+    ]
+    parts.extend(
+        f" <tr><td>{line.play_name}</td><td>{line.seats}</td>"
+        f"<td>{format_as_dollars(line.amount)}</td></tr>"
+        for line in statement.statement_lines
+    )
+    parts.append("</table>")
+    parts.append(f"<p>Amount owed is <em>{format_as_dollars(statement.total)}</em></p>")
+    parts.append(f"<p>You earned <em>{statement.credits}</em> credits</p>")
+    return "\n".join(parts)
+
+
+def tragedy_amount(audience: int) -> int:
+    amount = 40000
+    if audience > 30:
+        amount += 1000 * (audience - 30)
+    return amount
+
+
+def tragedy_credits(audience: int) -> int:
+    return max(audience - 30, 0)
+
+
+def comedy_amount(audience: int) -> int:
+    amount = 30000 + 300 * audience
+    if audience > 20:
+        amount += 10000 + 500 * (audience - 20)
+    return amount
+
+
+def comedy_credits(audience: int) -> int:
+    return max(audience - 30, 0) + audience // 5
+
+
+BillingFunction = Callable[[int], int]
+
+# Maps a play type to its (amount, credits) functions.
+# Add new play types here
+BILLING: dict[str, tuple[BillingFunction, BillingFunction]] = {
+    "tragedy": (tragedy_amount, tragedy_credits),
+    "comedy": (comedy_amount, comedy_credits),
+}
 
 
 def calculate(invoice: Invoice, plays: AllPlays) -> Statement:
-    lines, credits = functools.reduce(lambda total, strategy:
-        (total[0] + [strategy.statement_line()], total[1] + strategy.credits()),
-        (billing_strategy(plays, perf) for perf in invoice["performances"]),
-        ([], 0)
-    )
-    return Statement(invoice["customer"], lines, credits)
+    lines = []
+    credits = 0
+    for perf in invoice["performances"]:
+        play = plays[perf["playID"]]
+        try:
+            amount_fn, credits_fn = BILLING[play["type"]]
+        except KeyError:
+            raise ValueError(f"unknown type: {play['type']}") from None
+        audience = perf["audience"]
+        lines.append(StatementLine(play["name"], amount_fn(audience), audience))
+        credits += credits_fn(audience)
+    return Statement(invoice["customer"], tuple(lines), credits)
 
 
 def statement(invoice: Invoice, plays: AllPlays) -> str:
@@ -140,3 +134,25 @@ def statement(invoice: Invoice, plays: AllPlays) -> str:
 
 def html_statement(invoice: Invoice, plays: AllPlays) -> str:
     return render_as_html(calculate(invoice, plays))
+
+
+# Plays catalog for the current worker process, set once by _init_worker
+_worker_plays: AllPlays = {}
+
+
+def _init_worker(plays: AllPlays) -> None:
+    global _worker_plays
+    _worker_plays = plays
+
+
+def _worker_statement(invoice: Invoice) -> str:
+    return statement(invoice, _worker_plays)
+
+
+def statements(invoices: list[Invoice], plays: AllPlays) -> list[str]:
+    """Render text statements for many invoices in parallel worker processes."""
+    if not invoices:
+        return []
+    chunksize = max(1, len(invoices) // ((os.cpu_count() or 1) * 4))
+    with ProcessPoolExecutor(initializer=_init_worker, initargs=(plays,)) as executor:
+        return list(executor.map(_worker_statement, invoices, chunksize=chunksize))
@@ -4,7 +4,15 @@ import pytest
 from approvaltests import verify
 from approval_utilities.utils import get_adjacent_file
 
-from statement import html_statement, statement
+from statement import (
+    Statement,
+    StatementLine,
+    format_as_dollars,
+    html_statement,
+    render_as_html,
+    statement,
+    statements,
+)
 
 
 def test_example_statement():
@@ -33,3 +41,30 @@ def test_statement_with_new_play_types():
     assert "unknown type" in str(exception_info.value)
 
 
+
+
+def test_statements_for_many_invoices():
+    with open(get_adjacent_file("invoice.json")) as f:
+        invoice = json.loads(f.read())
+    with open(get_adjacent_file("plays.json")) as f:
+        plays = json.loads(f.read())
+    other = {"customer": "SmallCo", "performances": invoice["performances"][:1]}
+    assert statements([invoice, other], plays) == [statement(invoice, plays), statement(other, plays)]
+
+
+def test_statement_lines_can_be_iterated_twice():
+    lines = (StatementLine(name, amount, 10) for name, amount in [("A", 100), ("B", 250)])
+    result = Statement("Customer", lines, 0)
+    assert result.total == 350
+    assert render_as_html(result) == render_as_html(result)
+
+
+@pytest.mark.parametrize("cents, expected", [
+    (0, "$0.00"),
+    (5, "$0.05"),
+    (173000, "$1,730.00"),
+    (-12345, "-$123.45"),
+    (123456789012345678, "$1,234,567,890,123,456.78"),
+])
+def test_format_as_dollars(cents, expected):
+    assert format_as_dollars(cents) == expected